@@ -9,8 +9,211 @@ real-world examples and practical use cases.
 from robot.api.deco import keyword
 from typing import List, Dict, Optional, Union, Any
 from datetime import datetime
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
+import hashlib
 import json
 import re
+import time
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Placeholder syntax used by `Format String Template`: {name}, {name:default}, {name!transform}
+_PLACEHOLDER_RE = re.compile(r'\{([^}]+)\}')
+
+# `!transform` suffixes supported by `Format String Template`
+_TRANSFORMS = {"upper": str.upper, "lower": str.lower, "title": str.title}
+
+# Anything str.format_map would interpret differently from the placeholder syntax above
+_CUSTOM_PLACEHOLDER_RE = re.compile(r'\{\{|\}\}|\{[^}]*[:!.\[]')
+
+
+# orjson reads integers outside the int64/uint64 range as floats; text with a
+# run of 19 or more digits is left to the stdlib so such numbers stay exact
+# ints (19 digits already reach below the int64 minimum for negative numbers)
+_LONG_DIGITS_RE = re.compile(r'\d{19}')
+
+
+def _json_loads(data: str) -> Any:
+    """Parse JSON text, with orjson when installed and the stdlib otherwise."""
+    if ORJSON_AVAILABLE and not _LONG_DIGITS_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Input orjson rejects but the stdlib accepts (NaN, Infinity, a BOM),
+            # or genuinely invalid JSON, which then raises the usual error
+            pass
+    return json.loads(data)
+
+
+def _canonical_json(data: Any) -> bytes:
+    """
+    Serialize data as compact, key-sorted UTF-8 JSON for hashing.
+    
+    Always uses the stdlib encoder: orjson writes floats such as 1e16 and NaN
+    differently, which would make snapshot hashes depend on what is installed.
+    """
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> "re.Pattern":
+    """Compile a user supplied regex once and reuse it across keyword calls."""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=128)
+def _parse_mapping(mapping_items: tuple) -> tuple:
+    """Split dotted source paths of a `Transform JSON Data` mapping once per mapping."""
+    return tuple(
+        (target_field, source_field, tuple(source_field.split(".")) if "." in source_field else None)
+        for target_field, source_field in mapping_items
+    )
+
+
+def _deep_merge(dictionaries: tuple) -> Dict[str, Any]:
+    """
+    Merge dictionaries recursively using an explicit stack instead of recursion.
+    
+    Nested dicts coming from the inputs are copied before they are merged into,
+    so the caller's dictionaries are never modified.
+    """
+    result = dictionaries[0].copy()
+    # Dicts created here (keyed by id) can be merged into in place
+    owned = {id(result): result}
+    for d in dictionaries[1:]:
+        stack = [(result, d)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                if key in target and isinstance(target[key], dict) and isinstance(value, dict):
+                    nested = target[key]
+                    if id(nested) not in owned:
+                        nested = target[key] = nested.copy()
+                        owned[id(nested)] = nested
+                    stack.append((nested, value))
+                else:
+                    target[key] = value
+    return result
+
+
+# [monotonic time of last refresh, ISO timestamp] shared by back-to-back snapshots
+_timestamp_cache = [float("-inf"), ""]
+
+
+def _snapshot_timestamp() -> str:
+    """Return `datetime.now().isoformat()`, reformatted at most once per millisecond."""
+    now = time.monotonic()
+    if now - _timestamp_cache[0] >= 0.001:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = datetime.now().isoformat()
+    return _timestamp_cache[1]
+
+
+# Below this size the NumPy conversion costs more than the pure Python sort and
+# reductions (measured crossover is ~500 values for random input, ~5000 if presorted)
+_NUMPY_MIN_SIZE = 5000
+
+
+def _numpy_array(numbers: List[Union[int, float]]) -> Optional["np.ndarray"]:
+    """
+    Convert `numbers` for the NumPy path, or return None to keep it in Python.
+    
+    Only lists of plain ints that fit in int64, or of plain floats without
+    NaN or zeros, are converted: for those, every value NumPy picks out is the
+    same Python object type and value that the pure Python path reports. Mixed
+    lists would come back as floats, and NaN and signed zeros are ordered
+    differently by `sorted` and `np.partition`.
+    """
+    kinds = set(map(type, numbers))
+    if kinds == {int}:
+        arr = np.asarray(numbers)
+        # Ints beyond int64 give an object array
+        return arr if arr.dtype.kind == "i" else None
+    if kinds == {float}:
+        arr = np.asarray(numbers)
+        return None if np.isnan(arr).any() or not arr.all() else arr
+    return None
+
+
+def _numpy_statistics(arr: "np.ndarray", total: Union[int, float], include_percentiles: bool) -> Dict[str, float]:
+    """
+    Compute `Calculate Statistics` results for a numeric NumPy array.
+    
+    The total is passed in from Python's `sum` so it matches the pure Python
+    path to the last digit; NumPy's pairwise float summation does not.
+    """
+    count = arr.shape[0]
+    middle = count // 2
+    median_indices = [middle] if count % 2 == 1 else [middle - 1, middle]
+    percentile_indices = {}
+    if include_percentiles:
+        percentile_indices = {str(p): int((p / 100) * (count - 1)) for p in [25, 50, 75, 95]}
+    
+    # Partial sort: only the order statistics we report end up in place
+    ordered = np.partition(arr, sorted(set(median_indices) | set(percentile_indices.values())))
+    
+    min_val = arr.min().item()
+    max_val = arr.max().item()
+    if count % 2 == 1:
+        median = ordered[middle].item()
+    else:
+        median = (ordered[middle - 1].item() + ordered[middle].item()) / 2
+    
+    result = {
+        "count": count,
+        "sum": total,
+        "mean": round(total / count, 2),
+        "median": round(median, 2),
+        "min": min_val,
+        "max": max_val,
+        "range": max_val - min_val
+    }
+    
+    if include_percentiles:
+        result["percentiles"] = {p: ordered[i].item() for p, i in percentile_indices.items()}
+    
+    return result
+
+
+def _unmatched(items: List[Any], matched: Counter) -> List[Any]:
+    """Return `items` in order, leaving out as many occurrences of each value as `matched` counts."""
+    unmatched = []
+    for item in items:
+        if matched[item]:
+            matched[item] -= 1
+        else:
+            unmatched.append(item)
+    return unmatched
+
+
+class _TemplateVariables(dict):
+    """Variables mapping for `str.format_map` applying the `missing_handler` policy."""
+    
+    def __init__(self, variables: Dict[str, Any], missing_handler: str):
+        super().__init__(variables)
+        self.missing_handler = missing_handler
+    
+    def __missing__(self, key: str) -> str:
+        if self.missing_handler == "error":
+            raise ValueError(f"Missing variable: {key}")
+        if self.missing_handler == "default":
+            return ""
+        return "{" + key + "}"
 
 
 class DataProcessor:
@@ -28,10 +231,11 @@ class DataProcessor:
     ROBOT_LIBRARY_VERSION = "2.5.0"
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
     
+    # Keywords keep no per-instance state; caches live at module level
+    __slots__ = ()
+    
     def __init__(self):
         """Initialize the DataProcessor library."""
-        self._cache = {}
-        self._history = []
     
     @keyword
     def validate_json_structure(self, json_data: Union[str, dict], schema: Dict[str, Any]) -> bool:
@@ -73,14 +277,15 @@ class DataProcessor:
         """
         if isinstance(json_data, str):
             try:
-                json_data = json.loads(json_data)
+                json_data = _json_loads(json_data)
             except json.JSONDecodeError:
                 return False
         
         for key, expected_type in schema.items():
             if key not in json_data:
                 return False
-            if not isinstance(json_data[key], expected_type):
+            value = json_data[key]
+            if type(value) is not expected_type and not isinstance(value, expected_type):
                 return False
         
         return True
@@ -131,14 +336,14 @@ class DataProcessor:
         ```
         """
         if isinstance(data, str):
-            data = json.loads(data)
+            data = _json_loads(data)
         
         result = {}
-        for target_field, source_field in mapping.items():
-            if "." in source_field:
+        for target_field, source_field, path in _parse_mapping(tuple(mapping.items())):
+            if path is not None:
                 # Nested field access
                 value = data
-                for part in source_field.split("."):
+                for part in path:
                     value = value.get(part, default_value)
                     if value is None:
                         break
@@ -201,26 +406,33 @@ class DataProcessor:
             ${valid}    Filter List By Condition    ${emails}    matches_regex    ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$
         ```
         """
-        result = []
-        for item in items:
-            match = False
-            if condition == "equals":
-                match = item == value
-            elif condition == "contains":
-                match = value in str(item)
-            elif condition == "greater_than":
-                match = isinstance(item, (int, float)) and item > value
-            elif condition == "less_than":
-                match = isinstance(item, (int, float)) and item < value
-            elif condition == "type_is":
-                match = isinstance(item, value if isinstance(value, type) else type(value))
-            elif condition == "matches_regex":
-                match = bool(re.match(value, str(item)))
-            
-            if match:
-                result.append(item)
+        # Resolve the condition once so the loop only evaluates a predicate
+        if condition == "equals":
+            def predicate(item):
+                return item == value
+        elif condition == "contains":
+            def predicate(item):
+                return value in str(item)
+        elif condition == "greater_than":
+            def predicate(item):
+                return isinstance(item, (int, float)) and item > value
+        elif condition == "less_than":
+            def predicate(item):
+                return isinstance(item, (int, float)) and item < value
+        elif condition == "type_is":
+            expected_type = value if isinstance(value, type) else type(value)
+
+            def predicate(item):
+                return isinstance(item, expected_type)
+        elif condition == "matches_regex":
+            match = _compile(value).match
+
+            def predicate(item):
+                return match(str(item)) is not None
+        else:
+            return []
         
-        return result
+        return [item for item in items if predicate(item)]
     
     @keyword
     def merge_dictionaries(self, 
@@ -280,22 +492,14 @@ class DataProcessor:
         result = {}
         
         if strategy == "keep_first":
-            for d in dictionaries:
-                for key, value in d.items():
-                    if key not in result:
-                        result[key] = value
-        elif strategy == "keep_last":
-            for d in dictionaries:
+            # Seed keys in first-seen order, then apply the dicts last to first
+            # so the earliest value wins without a per-key Python loop
+            result = dict.fromkeys(chain.from_iterable(dictionaries))
+            for d in reversed(dictionaries):
                 result.update(d)
         elif strategy == "deep_merge":
-            result = dictionaries[0].copy()
-            for d in dictionaries[1:]:
-                for key, value in d.items():
-                    if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                        result[key] = self.merge_dictionaries(result[key], value, strategy="deep_merge")
-                    else:
-                        result[key] = value
-        else:  # override (default)
+            result = _deep_merge(dictionaries)
+        else:  # override (default) and keep_last
             for d in dictionaries:
                 result.update(d)
         
@@ -358,14 +562,18 @@ class DataProcessor:
             ${result}    Format String Template    ${template}    ${vars}    missing_handler=default
         ```
         """
-        result = template
-        
-        # Find all placeholders
-        placeholder_pattern = r'\{([^}]+)\}'
-        placeholders = re.findall(placeholder_pattern, template)
+        if not _CUSTOM_PLACEHOLDER_RE.search(template):
+            # Plain {name} placeholders only, let the C-level formatter handle them
+            try:
+                return template.format_map(_TemplateVariables(variables, missing_handler))
+            except ValueError:
+                # Unbalanced braces or positional fields, the regex path below
+                # handles those (and re-raises missing variable errors)
+                pass
         
-        for placeholder in placeholders:
+        def substitute(match):
             # Parse placeholder (name:default or name!transform)
+            placeholder = match.group(1)
             var_name = placeholder
             default_value = None
             transform = None
@@ -385,20 +593,17 @@ class DataProcessor:
             elif missing_handler == "default":
                 value = ""
             else:  # skip
-                continue
+                return match.group(0)
             
             # Apply transformation
-            if transform == "upper":
-                value = str(value).upper()
-            elif transform == "lower":
-                value = str(value).lower()
-            elif transform == "title":
-                value = str(value).title()
+            transform_func = _TRANSFORMS.get(transform)
+            if transform_func is not None:
+                return transform_func(str(value))
             
-            # Replace placeholder
-            result = result.replace(f"{{{placeholder}}}", str(value))
+            return str(value)
         
-        return result
+        # Replace all placeholders in a single pass over the template
+        return _PLACEHOLDER_RE.sub(substitute, template)
     
     @keyword
     def extract_data_by_pattern(self, 
@@ -452,14 +657,13 @@ class DataProcessor:
         | `\\w+@\\w+\\.\\w+` | Email addresses | `"user@example.com"` |
         | `\\$\\{[^}]+\\}` | Robot variables | `${variable}` from Robot Framework code |
         """
-        matches = re.findall(pattern, text)
+        compiled = _compile(pattern)
+        matches = compiled.findall(text)
         
-        if group is not None:
+        # findall only yields tuples when the pattern has several groups
+        if group is not None and compiled.groups > 1:
             # Extract specific capture group
-            compiled = re.compile(pattern)
-            matches = [m[group] if isinstance(m, tuple) else m for m in matches]
-            if matches:
-                return matches[0] if len(matches) == 1 else matches
+            matches = [m[group] for m in matches]
         
         return matches if len(matches) > 1 else (matches[0] if matches else "")
     
@@ -477,7 +681,7 @@ class DataProcessor:
         **Arguments:**
         - `data1`: First data structure (baseline)
         - `data2`: Second data structure (to compare)
-        - `ignore_order`: If True, list order is ignored (default: False)
+        - `ignore_order`: If True, list order is ignored but duplicates are still counted (default: False)
         
         **Returns:** Dictionary with comparison results:
         - `equal`: Boolean indicating if structures are identical
@@ -521,37 +725,46 @@ class DataProcessor:
         }
         
         if isinstance(data1, dict) and isinstance(data2, dict):
-            all_keys = set(data1.keys()) | set(data2.keys())
-            
-            for key in all_keys:
-                if key not in data1:
-                    result["added"][key] = data2[key]
-                    result["equal"] = False
-                elif key not in data2:
-                    result["removed"][key] = data1[key]
-                    result["equal"] = False
-                elif data1[key] != data2[key]:
-                    result["modified"][key] = (data1[key], data2[key])
-                    result["equal"] = False
+            # Set operations on key views run in C without building key sets first
+            keys1, keys2 = data1.keys(), data2.keys()
+            result["added"] = {key: data2[key] for key in keys2 - keys1}
+            result["removed"] = {key: data1[key] for key in keys1 - keys2}
+            result["modified"] = {
+                key: (data1[key], data2[key]) for key in keys1 & keys2 if data1[key] != data2[key]
+            }
+            result["equal"] = not (result["added"] or result["removed"] or result["modified"])
         
         elif isinstance(data1, list) and isinstance(data2, list):
             if ignore_order:
-                if set(data1) != set(data2):
+                try:
+                    matched = Counter(data1) & Counter(data2)
+                    # Walk each list so the surplus items keep their input order,
+                    # skipping the first occurrences that have a match
+                    removed = _unmatched(data1, matched.copy())
+                    added = _unmatched(data2, matched)
+                except TypeError:
+                    # Unhashable items: match them off one by one
+                    removed = list(data1)
+                    added = []
+                    for item in data2:
+                        try:
+                            removed.remove(item)
+                        except ValueError:
+                            added.append(item)
+                if added or removed:
                     result["equal"] = False
-                    result["added"] = [x for x in data2 if x not in data1]
-                    result["removed"] = [x for x in data1 if x not in data2]
+                    result["added"] = added
+                    result["removed"] = removed
             else:
                 if data1 != data2:
                     result["equal"] = False
-                    # Find differences
-                    max_len = max(len(data1), len(data2))
-                    for i in range(max_len):
-                        if i >= len(data1):
-                            result["added"][i] = data2[i]
-                        elif i >= len(data2):
-                            result["removed"][i] = data1[i]
-                        elif data1[i] != data2[i]:
-                            result["modified"][i] = (data1[i], data2[i])
+                    # Find differences in the common prefix, then take the longer tail
+                    result["modified"] = {
+                        i: (a, b) for i, (a, b) in enumerate(zip(data1, data2)) if a != b
+                    }
+                    common = min(len(data1), len(data2))
+                    result["added"].update(enumerate(data2[common:], start=common))
+                    result["removed"].update(enumerate(data1[common:], start=common))
         
         return result
     
@@ -608,27 +821,25 @@ class DataProcessor:
             # Use dot notation: "user.department"
         ```
         """
-        grouped = {}
+        grouped = defaultdict(list)
         
-        for item in items:
-            if "." in key:
-                # Nested key access
+        if "." in key:
+            # Nested key access
+            parts = key.split(".")
+            for item in items:
                 value = item
-                for part in key.split("."):
+                for part in parts:
                     if isinstance(value, dict):
                         value = value.get(part)
                     else:
                         value = None
                         break
-                group_key = str(value) if value is not None else default_group
-            else:
-                group_key = str(item.get(key, default_group))
-            
-            if group_key not in grouped:
-                grouped[group_key] = []
-            grouped[group_key].append(item)
+                grouped[str(value) if value is not None else default_group].append(item)
+        else:
+            for item in items:
+                grouped[str(item.get(key, default_group))].append(item)
         
-        return grouped
+        return dict(grouped)
     
     @keyword
     def calculate_statistics(self, 
@@ -688,6 +899,11 @@ class DataProcessor:
         if not numbers:
             return {"count": 0, "sum": 0, "mean": 0, "median": 0, "min": 0, "max": 0, "range": 0}
         
+        if NUMPY_AVAILABLE and len(numbers) >= _NUMPY_MIN_SIZE:
+            arr = _numpy_array(numbers)
+            if arr is not None:
+                return _numpy_statistics(arr, sum(numbers), include_percentiles)
+        
         sorted_nums = sorted(numbers)
         count = len(numbers)
         total = sum(numbers)
@@ -762,21 +978,27 @@ class DataProcessor:
         snapshot = {"data": data}
         
         if include_metadata:
-            import hashlib
             metadata = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _snapshot_timestamp(),
                 "type": type(data).__name__,
             }
             
+            # Serialize once: the same bytes feed the size fields and the hash
             if isinstance(data, (dict, list)):
                 metadata["size"] = len(data)
+                data_bytes = _canonical_json(data)
             elif isinstance(data, str):
+                data_bytes = data.encode('utf-8')
                 metadata["size"] = len(data)
-                metadata["bytes"] = len(data.encode('utf-8'))
+                metadata["bytes"] = len(data_bytes)
+            elif isinstance(data, (bytes, bytearray)):
+                # hashlib reads the buffer directly, no copy needed
+                data_bytes = data
+            else:
+                data_bytes = str(data).encode()
             
             # Create hash for comparison
-            data_str = json.dumps(data, sort_keys=True) if isinstance(data, (dict, list)) else str(data)
-            metadata["hash"] = hashlib.md5(data_str.encode()).hexdigest()
+            metadata["hash"] = hashlib.blake2b(data_bytes, digest_size=16).hexdigest()
             
             snapshot["metadata"] = metadata
         
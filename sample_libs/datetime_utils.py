@@ -6,9 +6,98 @@ Provides keywords for date parsing, formatting, calculations, and timezone handl
 """
 
 from robot.api.deco import keyword
-from typing import Optional
-from datetime import datetime, timedelta
-import calendar
+from typing import List, Optional
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+import re
+from time import time as _time
+
+
+# Pre-bound to skip the attribute lookup on every call
+_now = datetime.now
+_strptime = datetime.strptime
+_fromisoformat = datetime.fromisoformat
+_fromtimestamp = datetime.fromtimestamp
+
+# Format used by every keyword when `format` is not given
+_DEFAULT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Times used by `Get Start Of Day` / `Get End Of Day`
+_START_OF_DAY = time(0, 0, 0)
+_END_OF_DAY = time(23, 59, 59, 999999)
+
+# Length in seconds of the sub-day units supported by `Get Date Difference`
+_UNIT_SECONDS = {"hours": 3600, "minutes": 60, "seconds": 1}
+
+# English day/month names, indexed like datetime.weekday() and datetime.month
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTH_NAMES = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+# strptime formats whose output shape datetime.fromisoformat parses identically,
+# mapped to the date/time separator (None for date-only formats)
+_ISO_FORMATS = {
+    "%Y-%m-%d %H:%M:%S": " ",
+    "%Y-%m-%dT%H:%M:%S": "T",
+    "%Y-%m-%d": None,
+}
+
+
+# Exact shape of the strings `datetime.fromisoformat` is tried on for each ISO format
+_ISO_SHAPES = {
+    fmt: re.compile(r"\d{4}-\d\d-\d\d" + (separator + r"\d\d:\d\d:\d\d" if separator else ""), re.ASCII)
+    for fmt, separator in _ISO_FORMATS.items()
+}
+
+
+def _parse_uncached(date_string: str, fmt: str = _DEFAULT_FORMAT) -> datetime:
+    """
+    Parse `date_string` like `datetime.strptime(date_string, fmt)`.
+    
+    For ISO formats, strings of exactly the expected shape go through the much
+    faster `datetime.fromisoformat`. Anything else (including strings
+    fromisoformat rejects) is left to strptime so errors stay the same.
+    """
+    shape = _ISO_SHAPES.get(fmt)
+    if shape is not None and shape.fullmatch(date_string):
+        try:
+            return _fromisoformat(date_string)
+        except ValueError:
+            pass
+    return _strptime(date_string, fmt)
+
+
+# Results are memoized: test suites tend to reuse the same date literals, and
+# datetime objects are immutable so sharing is safe. Keywords use
+# _parse_default when no `format` is given, keyed on the string alone.
+_parse = lru_cache(maxsize=1024)(_parse_uncached)
+_parse_default = lru_cache(maxsize=1024)(_parse_uncached)
+
+
+def _parse_input(date_string: str, format: Optional[str]) -> datetime:
+    """Parse a keyword's date argument with its `format`, or the default format if none is given."""
+    if not format:
+        return _parse_default(date_string)
+    return _parse(date_string, format)
+
+
+def _format(dt: datetime, fmt: str) -> str:
+    """
+    Format `dt` like `dt.strftime(fmt)`.
+    
+    ISO formats are produced with `isoformat`, which skips strftime's
+    directive parsing. Years below 1000 (platform dependent `%Y` padding)
+    and timezone-aware values (isoformat would append the offset) keep
+    using strftime.
+    """
+    if fmt in _ISO_FORMATS and isinstance(dt, datetime) and dt.tzinfo is None and dt.year >= 1000:
+        separator = _ISO_FORMATS[fmt]
+        if separator is None:
+            return dt.date().isoformat()
+        return dt.isoformat(separator, "seconds")
+    return dt.strftime(fmt)
 
 
 class DateTimeUtils:
@@ -26,9 +115,11 @@ class DateTimeUtils:
     ROBOT_LIBRARY_VERSION = "1.3.0"
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
     
+    # The default format and parse caches live at module level
+    __slots__ = ()
+    
     def __init__(self):
         """Initialize the DateTimeUtils library."""
-        self._default_format = "%Y-%m-%d %H:%M:%S"
     
     @keyword
     def get_current_datetime(self, format: Optional[str] = None) -> str:
@@ -54,8 +145,8 @@ class DateTimeUtils:
             Should Match Regexp    ${custom}    \\d{4}-\\d{2}-\\d{2}
         ```
         """
-        fmt = format or self._default_format
-        return datetime.now().strftime(fmt)
+        fmt = format or _DEFAULT_FORMAT
+        return _format(_now(), fmt)
     
     @keyword
     def parse_datetime(self, date_string: str, format: Optional[str] = None) -> datetime:
@@ -80,8 +171,36 @@ class DateTimeUtils:
             Should Not Be None    ${dt}
         ```
         """
-        fmt = format or self._default_format
-        return datetime.strptime(date_string, fmt)
+        return _parse_input(date_string, format)
+    
+    @keyword
+    def parse_datetime_list(self, date_strings: List[str], format: Optional[str] = None) -> List[datetime]:
+        """
+        Parse a list of date strings into datetime objects.
+        
+        Same as calling `Parse Datetime` for each item, but done in a single
+        keyword call, which is much faster for long lists such as query results.
+        
+        **Arguments:**
+        - `date_strings`: List of date strings to parse
+        - `format`: Optional format string (default: YYYY-MM-DD HH:MM:SS)
+        
+        **Returns:** List of datetime objects, in the same order
+        
+        **Example:**
+        ```robot
+        *** Settings ***
+        Library    DateTimeUtils
+        
+        
+        *** Test Cases ***
+        Parse DateTime List Example
+            @{dates}    Create List    2024-01-15 10:30:00    2024-01-16 08:00:00
+            ${parsed}    Parse Datetime List    ${dates}
+            Length Should Be    ${parsed}    2
+        ```
+        """
+        return [_parse_input(date_string, format) for date_string in date_strings]
     
     @keyword
     def format_datetime(self, dt: datetime, format: str = None) -> str:
@@ -107,8 +226,8 @@ class DateTimeUtils:
             Should Be Equal    ${formatted}    15/01/2024
         ```
         """
-        fmt = format or self._default_format
-        return dt.strftime(fmt)
+        fmt = format or _DEFAULT_FORMAT
+        return _format(dt, fmt)
     
     @keyword
     def add_days(self, date_string: str, days: int, format: Optional[str] = None) -> str:
@@ -135,10 +254,10 @@ class DateTimeUtils:
             Should Not Be Equal    ${future}    ${past}
         ```
         """
-        fmt = format or self._default_format
-        dt = datetime.strptime(date_string, fmt)
-        new_dt = dt + timedelta(days=days)
-        return new_dt.strftime(fmt)
+        fmt = format or _DEFAULT_FORMAT
+        dt = _parse_input(date_string, format)
+        new_dt = dt + timedelta(days)
+        return _format(new_dt, fmt)
     
     @keyword
     def add_hours(self, date_string: str, hours: int, format: Optional[str] = None) -> str:
@@ -164,10 +283,10 @@ class DateTimeUtils:
             Should Not Be Equal    ${later}    2024-01-15 10:30:00
         ```
         """
-        fmt = format or self._default_format
-        dt = datetime.strptime(date_string, fmt)
-        new_dt = dt + timedelta(hours=hours)
-        return new_dt.strftime(fmt)
+        fmt = format or _DEFAULT_FORMAT
+        dt = _parse_input(date_string, format)
+        new_dt = dt + timedelta(0, hours * 3600)
+        return _format(new_dt, fmt)
     
     @keyword
     def add_minutes(self, date_string: str, minutes: int, format: Optional[str] = None) -> str:
@@ -193,10 +312,10 @@ class DateTimeUtils:
             Should Not Be Equal    ${later}    2024-01-15 10:30:00
         ```
         """
-        fmt = format or self._default_format
-        dt = datetime.strptime(date_string, fmt)
-        new_dt = dt + timedelta(minutes=minutes)
-        return new_dt.strftime(fmt)
+        fmt = format or _DEFAULT_FORMAT
+        dt = _parse_input(date_string, format)
+        new_dt = dt + timedelta(0, minutes * 60)
+        return _format(new_dt, fmt)
     
     @keyword
     def get_date_difference(self, date1: str, date2: str, 
@@ -224,20 +343,15 @@ class DateTimeUtils:
             Should Be Equal As Integers    ${diff}    ${5}
         ```
         """
-        fmt = format or self._default_format
-        dt1 = datetime.strptime(date1, fmt)
-        dt2 = datetime.strptime(date2, fmt)
+        dt1 = _parse_input(date1, format)
+        dt2 = _parse_input(date2, format)
         delta = abs(dt2 - dt1)
         
-        if unit == "days":
+        unit_seconds = _UNIT_SECONDS.get(unit)
+        if unit_seconds is None:  # days, or an unknown unit
             return delta.days
-        elif unit == "hours":
-            return int(delta.total_seconds() / 3600)
-        elif unit == "minutes":
-            return int(delta.total_seconds() / 60)
-        elif unit == "seconds":
-            return int(delta.total_seconds())
-        return delta.days
+        # Whole seconds only; the delta is non-negative so // truncates like int()
+        return (delta.days * 86400 + delta.seconds) // unit_seconds
     
     @keyword
     def is_date_before(self, date1: str, date2: str, format: Optional[str] = None) -> bool:
@@ -263,9 +377,8 @@ class DateTimeUtils:
             Should Be True    ${result}
         ```
         """
-        fmt = format or self._default_format
-        dt1 = datetime.strptime(date1, fmt)
-        dt2 = datetime.strptime(date2, fmt)
+        dt1 = _parse_input(date1, format)
+        dt2 = _parse_input(date2, format)
         return dt1 < dt2
     
     @keyword
@@ -292,9 +405,8 @@ class DateTimeUtils:
             Should Be True    ${result}
         ```
         """
-        fmt = format or self._default_format
-        dt1 = datetime.strptime(date1, fmt)
-        dt2 = datetime.strptime(date2, fmt)
+        dt1 = _parse_input(date1, format)
+        dt2 = _parse_input(date2, format)
         return dt1 > dt2
     
     @keyword
@@ -316,7 +428,8 @@ class DateTimeUtils:
             Should Be True    ${ts} > 0
         ```
         """
-        return datetime.now().timestamp()
+        # Same value as datetime.now().timestamp() without building a datetime
+        return _time()
     
     @keyword
     def timestamp_to_datetime(self, timestamp: float, format: Optional[str] = None) -> str:
@@ -342,9 +455,9 @@ class DateTimeUtils:
             Should Not Be Empty    ${dt}
         ```
         """
-        fmt = format or self._default_format
-        dt = datetime.fromtimestamp(timestamp)
-        return dt.strftime(fmt)
+        fmt = format or _DEFAULT_FORMAT
+        dt = _fromtimestamp(timestamp)
+        return _format(dt, fmt)
     
     @keyword
     def datetime_to_timestamp(self, date_string: str, format: Optional[str] = None) -> float:
@@ -369,8 +482,7 @@ class DateTimeUtils:
             Should Be True    ${ts} > 0
         ```
         """
-        fmt = format or self._default_format
-        dt = datetime.strptime(date_string, fmt)
+        dt = _parse_input(date_string, format)
         return dt.timestamp()
     
     @keyword
@@ -396,9 +508,8 @@ class DateTimeUtils:
             Should Be Equal    ${day}    Monday
         ```
         """
-        fmt = format or self._default_format
-        dt = datetime.strptime(date_string, fmt)
-        return calendar.day_name[dt.weekday()]
+        dt = _parse_input(date_string, format)
+        return _DAY_NAMES[dt.weekday()]
     
     @keyword
     def get_month_name(self, date_string: str, format: Optional[str] = None) -> str:
@@ -423,9 +534,8 @@ class DateTimeUtils:
             Should Be Equal    ${month}    January
         ```
         """
-        fmt = format or self._default_format
-        dt = datetime.strptime(date_string, fmt)
-        return calendar.month_name[dt.month]
+        dt = _parse_input(date_string, format)
+        return _MONTH_NAMES[dt.month]
     
     @keyword
     def is_weekend(self, date_string: str, format: Optional[str] = None) -> bool:
@@ -450,8 +560,7 @@ class DateTimeUtils:
             Should Be True    ${result}
         ```
         """
-        fmt = format or self._default_format
-        dt = datetime.strptime(date_string, fmt)
+        dt = _parse_input(date_string, format)
         return dt.weekday() >= 5
     
     @keyword
@@ -477,8 +586,7 @@ class DateTimeUtils:
             Should Be True    ${result}
         ```
         """
-        fmt = format or self._default_format
-        dt = datetime.strptime(date_string, fmt)
+        dt = _parse_input(date_string, format)
         return dt.weekday() < 5
     
     @keyword
@@ -504,10 +612,13 @@ class DateTimeUtils:
             Should End With    ${start}    00:00:00
         ```
         """
-        fmt = format or self._default_format
-        dt = datetime.strptime(date_string, fmt)
-        start_dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-        return start_dt.strftime(fmt)
+        fmt = format or _DEFAULT_FORMAT
+        dt = _parse_input(date_string, format)
+        if fmt == _DEFAULT_FORMAT and dt.year >= 1000:
+            # The time part is fixed, only the date needs formatting
+            return dt.date().isoformat() + " 00:00:00"
+        start_dt = datetime.combine(dt.date(), _START_OF_DAY, dt.tzinfo)
+        return _format(start_dt, fmt)
     
     @keyword
     def get_end_of_day(self, date_string: str, format: Optional[str] = None) -> str:
@@ -532,10 +643,13 @@ class DateTimeUtils:
             Should End With    ${end}    23:59:59
         ```
         """
-        fmt = format or self._default_format
-        dt = datetime.strptime(date_string, fmt)
-        end_dt = dt.replace(hour=23, minute=59, second=59, microsecond=999999)
-        return end_dt.strftime(fmt)
+        fmt = format or _DEFAULT_FORMAT
+        dt = _parse_input(date_string, format)
+        if fmt == _DEFAULT_FORMAT and dt.year >= 1000:
+            # The time part is fixed, only the date needs formatting
+            return dt.date().isoformat() + " 23:59:59"
+        end_dt = datetime.combine(dt.date(), _END_OF_DAY, dt.tzinfo)
+        return _format(end_dt, fmt)
     
     @keyword
     def get_age(self, birth_date: str, reference_date: Optional[str] = None,
@@ -562,15 +676,13 @@ class DateTimeUtils:
             Should Be Equal As Integers    ${age}    ${34}
         ```
         """
-        fmt = format or self._default_format
-        birth_dt = datetime.strptime(birth_date, fmt)
+        birth_dt = _parse_input(birth_date, format)
         if reference_date:
-            ref_dt = datetime.strptime(reference_date, fmt)
+            ref_dt = _parse_input(reference_date, format)
         else:
-            ref_dt = datetime.now()
+            ref_dt = _now()
         
-        age = ref_dt.year - birth_dt.year
-        if (ref_dt.month, ref_dt.day) < (birth_dt.month, birth_dt.day):
-            age -= 1
-        return age
+        # Birthday not reached yet this year when month*100+day is still smaller
+        return (ref_dt.year - birth_dt.year
+                - (ref_dt.month * 100 + ref_dt.day < birth_dt.month * 100 + birth_dt.day))
 
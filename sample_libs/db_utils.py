@@ -7,7 +7,6 @@ Provides keywords for database queries, data manipulation, and connection manage
 
 from robot.api.deco import keyword
 from typing import List, Dict, Optional, Any
-from datetime import datetime
 
 
 class DBUtils:
@@ -25,10 +24,12 @@ class DBUtils:
     ROBOT_LIBRARY_VERSION = "1.5.0"
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
     
+    __slots__ = ("_connection", "_tx_depth")
+    
     def __init__(self):
         """Initialize the DBUtils library."""
         self._connection = None
-        self._transactions = []
+        self._tx_depth = 0
     
     @keyword
     def connect_to_database(self, host: str, database: str, 
@@ -102,6 +103,44 @@ class DBUtils:
             {"id": 2, "name": "Jane", "age": 28}
         ]
     
+    @keyword
+    def execute_query_columnar(self, query: str, params: Optional[List[Any]] = None) -> Dict[str, List[Any]]:
+        """
+        Execute a SELECT query and return results grouped by column.
+        
+        Unlike `Execute Query`, which builds one dictionary per row, this
+        returns a single dictionary mapping each column name to the list of
+        its values in row order. This is cheaper for large result sets and
+        convenient when checking a whole column at once.
+        
+        **Arguments:**
+        - `query`: SQL SELECT query string
+        - `params`: Optional list of query parameters
+        
+        **Returns:** Dictionary mapping column names to lists of values
+        
+        **Example:**
+        ```robot
+        *** Settings ***
+        Library    DBUtils
+        
+        
+        *** Test Cases ***
+        Execute Query Columnar Example
+            Connect To Database    localhost    mydb    admin    secret123
+            ${columns}    Execute Query Columnar    SELECT id, name, age FROM users
+            Should Contain    ${columns}[name]    John
+            [Teardown]    Disconnect From Database
+        ```
+        """
+        # Simulated query results for demo; a real driver would transpose
+        # cursor.fetchall() once with zip(*rows) against cursor.description.
+        return {
+            "id": [1, 2],
+            "name": ["John", "Jane"],
+            "age": [30, 28]
+        }
+    
     @keyword
     def execute_non_query(self, query: str, params: Optional[List[Any]] = None) -> int:
         """
@@ -273,23 +312,23 @@ class DBUtils:
             [Teardown]    Disconnect From Database
         ```
         """
-        self._transactions.append({"started": datetime.now()})
+        self._tx_depth += 1
     
     @keyword
     def commit_transaction(self) -> None:
         """
         Commit the current transaction.
         """
-        if self._transactions:
-            self._transactions.pop()
+        if self._tx_depth:
+            self._tx_depth -= 1
     
     @keyword
     def rollback_transaction(self) -> None:
         """
         Rollback the current transaction.
         """
-        if self._transactions:
-            self._transactions.pop()
+        if self._tx_depth:
+            self._tx_depth -= 1
     
     @keyword
     def query_single_row(self, query: str, params: Optional[List[Any]] = None) -> Dict[str, Any]:
@@ -55,6 +55,36 @@ class TemperatureUnit(Enum):
     KELVIN = "kelvin"
 
 
+# Temperature units bound once, so `Convert Temperature` skips the Enum class
+# attribute lookups; members are singletons and compare by identity
+_FAHRENHEIT = TemperatureUnit.FAHRENHEIT
+_KELVIN = TemperatureUnit.KELVIN
+
+# Reverse lookup used by `Get Status By Value`
+_STATUS_BY_VALUE = {status.value: status for status in Status}
+
+# Result of `Get Status Info` for each status
+_STATUS_DESCRIPTIONS = {
+    Status.PENDING: "Item is waiting to be processed",
+    Status.ACTIVE: "Item is currently being processed",
+    Status.COMPLETED: "Item processing has been completed",
+    Status.CANCELLED: "Item processing was cancelled",
+    Status.FAILED: "Item processing failed"
+}
+_STATUS_INFO = {
+    status: {
+        "name": status.name,
+        "value": status.value,
+        "description": _STATUS_DESCRIPTIONS.get(status, "Unknown status")
+    }
+    for status in Status
+}
+
+# Member names returned by `Get All Statuses` / `Get All Priorities`
+_STATUS_NAMES = tuple(status.name for status in Status)
+_PRIORITY_NAMES = tuple(priority.name for priority in Priority)
+
+
 class EnumLibrary:
     """Sample library demonstrating Enum type usage.
     
@@ -91,8 +121,9 @@ class EnumLibrary:
             Set Log Level    level=ERROR
         ```
         """
-        print(f"Setting log level to: {level.value}")
-        return level.value
+        value = level.value
+        print(f"Setting log level to: {value}")
+        return value
     
     @keyword("Process With Status")
     def process_with_status(self, 
@@ -209,21 +240,21 @@ class EnumLibrary:
         ```
         """
         # Simplified conversion logic
-        if from_unit == to_unit:
+        if from_unit is to_unit:
             return value
         
         # Convert to Celsius first
-        if from_unit == TemperatureUnit.FAHRENHEIT:
+        if from_unit is _FAHRENHEIT:
             celsius = (value - 32) * 5 / 9
-        elif from_unit == TemperatureUnit.KELVIN:
+        elif from_unit is _KELVIN:
             celsius = value - 273.15
         else:
             celsius = value
         
         # Convert from Celsius to target
-        if to_unit == TemperatureUnit.FAHRENHEIT:
+        if to_unit is _FAHRENHEIT:
             return celsius * 9 / 5 + 32
-        elif to_unit == TemperatureUnit.KELVIN:
+        elif to_unit is _KELVIN:
             return celsius + 273.15
         else:
             return celsius
@@ -249,19 +280,8 @@ class EnumLibrary:
             ${info}    Get Status Info    ${Status.ACTIVE}
         ```
         """
-        status_descriptions = {
-            Status.PENDING: "Item is waiting to be processed",
-            Status.ACTIVE: "Item is currently being processed",
-            Status.COMPLETED: "Item processing has been completed",
-            Status.CANCELLED: "Item processing was cancelled",
-            Status.FAILED: "Item processing failed"
-        }
-        
-        return {
-            "name": status.name,
-            "value": status.value,
-            "description": status_descriptions.get(status, "Unknown status")
-        }
+        # Copy so callers can modify the result without touching the table
+        return dict(_STATUS_INFO[status])
     
     @keyword
     def create_task(self, 
@@ -346,7 +366,7 @@ class EnumLibrary:
             Should Contain    ${statuses}    ACTIVE
         ```
         """
-        return [status.name for status in Status]
+        return list(_STATUS_NAMES)
     
     @keyword
     def get_all_priorities(self) -> List[str]:
@@ -367,7 +387,7 @@ class EnumLibrary:
             Should Contain    ${priorities}    HIGH
         ```
         """
-        return [priority.name for priority in Priority]
+        return list(_PRIORITY_NAMES)
     
     @keyword
     def validate_status(self, status: Status) -> bool:
@@ -391,7 +411,8 @@ class EnumLibrary:
             Should Be True    ${valid}
         ```
         """
-        return status in Status
+        # Robot Framework has already converted the argument to a member
+        return isinstance(status, Status)
     
     @keyword
     def get_status_by_value(self, value: int) -> Optional[Status]:
@@ -415,7 +436,4 @@ class EnumLibrary:
             Should Be Equal    ${status.name}    ACTIVE
         ```
         """
-        for status in Status:
-            if status.value == value:
-                return status
-        return None
+        return _STATUS_BY_VALUE.get(value)
@@ -3,15 +3,83 @@ FileUtils Library
 
 A Robot Framework library for file and directory operations.
 Provides keywords for file manipulation, reading, writing, and directory management.
+
+Install the optional `orjson` package to speed up reading JSON files.
 """
 
 from robot.api.deco import keyword
+from fnmatch import translate
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 import os
+import re
 import shutil
 import json
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Pre-bound to skip the attribute lookup on every call
+_json_dump = json.dump
+
+
+# orjson reads integers outside the int64/uint64 range as floats; data with a
+# run of 19 or more digits is left to the stdlib so such numbers stay exact
+# ints (19 digits already reach below the int64 minimum for negative numbers)
+_LONG_DIGITS_RE = re.compile(rb'\d{19}')
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, with orjson when installed and the stdlib otherwise."""
+    if ORJSON_AVAILABLE and not _LONG_DIGITS_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Input orjson rejects but the stdlib accepts (NaN, a BOM), or
+            # genuinely invalid JSON, which then raises the usual error
+            pass
+    return json.loads(data)
+
+
+# Path.glob matches names case-insensitively on Windows only
+_GLOB_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+
+# Parent directories already created (or found) by the write keywords
+_known_dirs = set()
+
+
+def _open_for_write(file_path: str, encoding: str):
+    """
+    Open `file_path` for writing, creating its parent directories first.
+    
+    Parents seen before skip the mkdir calls. If one has been removed since
+    (e.g. by a test teardown), the open fails, the stale entry is dropped and
+    the directory is recreated.
+    """
+    parent = os.path.dirname(file_path)
+    if parent in _known_dirs:
+        try:
+            return open(file_path, "w", encoding=encoding)
+        except FileNotFoundError:
+            _known_dirs.discard(parent)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+        _known_dirs.add(parent)
+    return open(file_path, "w", encoding=encoding)
+
+
+@lru_cache(maxsize=128)
+def _compile_name_pattern(pattern: str):
+    """Translate a single-component glob pattern into a compiled name matcher."""
+    return re.compile(translate(pattern), _GLOB_FLAGS).match
+
 
 class FileUtils:
     """
@@ -82,8 +150,7 @@ class FileUtils:
             File Should Exist    output.txt
         ```
         """
-        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, "w", encoding=encoding) as f:
+        with _open_for_write(file_path, encoding) as f:
             f.write(content)
     
     @keyword
@@ -96,7 +163,7 @@ class FileUtils:
         
         **Returns:** True if file exists, False otherwise
         """
-        return Path(file_path).is_file()
+        return os.path.isfile(file_path)
     
     @keyword
     def directory_exists(self, dir_path: str) -> bool:
@@ -108,7 +175,8 @@ class FileUtils:
         
         **Returns:** True if directory exists, False otherwise
         """
-        return Path(dir_path).is_dir()
+        # Path('') means the current directory, which os.path.isdir('') rejects
+        return os.path.isdir(dir_path or ".")
     
     @keyword
     def create_directory(self, dir_path: str, parents: bool = True) -> None:
@@ -134,13 +202,14 @@ class FileUtils:
         Path(dir_path).mkdir(parents=parents, exist_ok=True)
     
     @keyword
-    def copy_file(self, source: str, destination: str) -> None:
+    def copy_file(self, source: str, destination: str, preserve_metadata: bool = True) -> None:
         """
         Copy a file from source to destination.
         
         **Arguments:**
         - `source`: Source file path
-        - `destination`: Destination file path
+        - `destination`: Destination file path or directory
+        - `preserve_metadata`: Also copy permissions and timestamps (default: True)
         
         **Example:**
         ```robot
@@ -154,18 +223,30 @@ class FileUtils:
             File Should Exist    backup/source.txt
         ```
         """
-        shutil.copy2(source, destination)
+        if preserve_metadata:
+            shutil.copy2(source, destination)
+            return
+        if os.path.isdir(destination):
+            destination = os.path.join(destination, os.path.basename(source))
+        # Content only; copyfile uses the kernel-side fast copy where available
+        shutil.copyfile(source, destination)
     
     @keyword
-    def move_file(self, source: str, destination: str) -> None:
+    def move_file(self, source: str, destination: str, same_filesystem: bool = False) -> None:
         """
         Move a file from source to destination.
         
         **Arguments:**
         - `source`: Source file path
-        - `destination`: Destination file path
+        - `destination`: Destination file path or directory
+        - `same_filesystem`: Rename in a single step, overwriting an existing file (default: False)
         """
-        shutil.move(source, destination)
+        if not same_filesystem:
+            shutil.move(source, destination)
+            return
+        if os.path.isdir(destination):
+            destination = os.path.join(destination, os.path.basename(source))
+        os.replace(source, destination)
     
     @keyword
     def delete_file(self, file_path: str) -> None:
@@ -202,10 +283,25 @@ class FileUtils:
             Should Not Be Empty    ${files}
         ```
         """
-        path = Path(directory)
-        if pattern:
-            return [str(f) for f in path.glob(pattern) if f.is_file()]
-        return [str(f) for f in path.iterdir() if f.is_file()]
+        if pattern and ("/" in pattern or os.sep in pattern or "**" in pattern):
+            # Patterns spanning directories need pathlib's recursive glob
+            return [str(f) for f in Path(directory).glob(pattern) if f.is_file()]
+        
+        # scandir reports the entry type without a stat call per file; paths
+        # are built like str(Path(directory) / name) to keep the same output
+        base = str(Path(directory))
+        prefix = "" if base == "." else os.path.join(base, "")
+        match = _compile_name_pattern(pattern) if pattern else None
+        try:
+            entries = os.scandir(base)
+        except OSError:
+            if match is None:
+                raise
+            # Path.glob yields nothing for a missing or unreadable directory
+            return []
+        with entries:
+            return [prefix + entry.name for entry in entries
+                    if (match is None or match(entry.name)) and entry.is_file()]
     
     @keyword
     def get_file_size(self, file_path: str) -> int:
@@ -241,8 +337,8 @@ class FileUtils:
             Should Be Equal    ${data}[key]    value
         ```
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return _json_loads(f.read())
     
     @keyword
     def write_json_file(self, file_path: str, data: dict, indent: int = 2) -> None:
@@ -267,9 +363,8 @@ class FileUtils:
             File Should Exist    config.json
         ```
         """
-        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent)
+        with _open_for_write(file_path, "utf-8") as f:
+            _json_dump(data, f, indent=indent)
     
     @keyword
     def get_file_extension(self, file_path: str) -> str:
@@ -293,6 +388,11 @@ class FileUtils:
             Should Be Equal    ${ext}    pdf
         ```
         """
+        extension = os.path.splitext(file_path)[1]
+        if extension:
+            return extension[1:]
+        # Let pathlib decide the odd cases splitext reads differently
+        # (trailing separators, names made only of leading dots)
         return Path(file_path).suffix.lstrip(".")
     
     @keyword
@@ -317,5 +417,12 @@ class FileUtils:
             Should Be Equal    ${path}    /home/user/documents/file.txt
         ```
         """
+        if paths and os.sep == "/":
+            joined = os.path.join(*paths)
+            # Return it as is when it is already in pathlib's normal form
+            # (no empty or "." components, no trailing slash)
+            if (joined not in ("", ".") and "//" not in joined and "/./" not in joined
+                    and not joined.endswith(("/", "/.")) and not joined.startswith("./")):
+                return joined
         return str(Path(*paths))
 
@@ -7,8 +7,12 @@ Provides keywords for making HTTP requests, handling responses, and API testing.
 
 from robot.api.deco import keyword
 from typing import Dict, Optional, Any
+from base64 import b64encode
 import json
 
+# Pre-bound to skip the attribute lookup on every call
+_json_loads = json.loads
+
 
 class HTTPClient:
     """
@@ -29,6 +33,9 @@ class HTTPClient:
         """Initialize the HTTPClient library."""
         self._session_headers = {}
         self._last_response = None
+        # (username, password, header value) of the last Set Basic Auth call;
+        # only one pair is kept and it is dropped by Clear Headers
+        self._basic_auth = None
     
     @keyword
     def http_get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -161,6 +168,7 @@ class HTTPClient:
         Clear all default headers.
         """
         self._session_headers.clear()
+        self._basic_auth = None
     
     @keyword
     def get_response_status(self, response: Dict[str, Any]) -> int:
@@ -212,7 +220,7 @@ class HTTPClient:
         """
         body = response.get("body", {})
         if isinstance(body, str):
-            return json.loads(body)
+            return _json_loads(body)
         return body
     
     @keyword
@@ -261,10 +269,11 @@ class HTTPClient:
             ${response}    Http Get    https://api.example.com/protected
         ```
         """
-        import base64
-        credentials = f"{username}:{password}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        self.set_header("Authorization", f"Basic {encoded}")
+        cached = self._basic_auth
+        if cached is None or cached[0] != username or cached[1] != password:
+            header = "Basic " + b64encode(f"{username}:{password}".encode()).decode()
+            cached = self._basic_auth = (username, password, header)
+        self.set_header("Authorization", cached[2])
     
     @keyword
     def set_bearer_token(self, token: str) -> None:
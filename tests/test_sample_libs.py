@@ -0,0 +1,863 @@
+"""
+Tests for the sample libraries.
+
+This module tests the optimized code paths of the bundled sample libraries,
+checking that they return the same results as the plain Python fallbacks.
+"""
+import copy
+import hashlib
+import itertools
+import json
+import math
+import os
+import re
+import shutil
+import string
+from datetime import datetime
+from pathlib import Path
+from typing import Any, ClassVar, Dict, List
+
+import pytest
+
+from sample_libs import (
+    data_processor,
+    datetime_utils,
+    db_utils,
+    enum_library,
+    file_utils,
+    http_client,
+    string_utils,
+)
+
+
+@pytest.fixture
+def processor():
+    """Create a DataProcessor instance."""
+    return data_processor.DataProcessor()
+
+
+@pytest.fixture
+def datetime_lib():
+    """Create a DateTimeUtils instance."""
+    return datetime_utils.DateTimeUtils()
+
+
+@pytest.fixture
+def client():
+    """Create an HTTPClient instance."""
+    return http_client.HTTPClient()
+
+
+@pytest.fixture
+def strings():
+    """Create a StringUtils instance."""
+    return string_utils.StringUtils()
+
+
+class TestCalculateStatistics:
+    """Test cases for Calculate Statistics."""
+
+    @pytest.mark.parametrize("numbers", [
+        [2**62] * 6000,
+        [-2**62] * 6000,
+        [2**62, -2**62, 2**62] * 2000,
+        list(range(6000)),
+        [i / 7 for i in range(1, 6001)],
+        [0.1] * 6000,
+        [1, 2.5] * 3000,
+        [3.0, 1.0, 2.0] * 2000,
+        [0.0, -0.0, 1.5] * 2000,
+        [float("inf"), 1.5, 2.5] * 2000,
+        [2**70, 1] * 3000,
+        [True, 2] * 3000,
+    ])
+    def test_large_input_matches_pure_python(self, processor, numbers, monkeypatch):
+        """Test that large inputs give exactly the pure Python results and types."""
+        result = processor.calculate_statistics(numbers, include_percentiles=True)
+        monkeypatch.setattr(data_processor, "NUMPY_AVAILABLE", False)
+        expected = processor.calculate_statistics(numbers, include_percentiles=True)
+
+        assert result == expected
+        assert [type(value) for value in result.values()] == [type(value) for value in expected.values()]
+        assert [type(value) for value in result["percentiles"].values()] == \
+            [type(value) for value in expected["percentiles"].values()]
+        assert [math.copysign(1, value) for value in (result["min"], result["max"])] == \
+            [math.copysign(1, value) for value in (expected["min"], expected["max"])]
+
+    def test_large_int_sum_does_not_overflow(self, processor):
+        """Test that integer totals beyond the int64 range stay exact."""
+        result = processor.calculate_statistics([2**62] * 6000)
+
+        assert result["sum"] == 2**62 * 6000
+        assert result["mean"] == 2**62
+
+    def test_small_input(self, processor):
+        """Test statistics for a short list."""
+        result = processor.calculate_statistics([85, 90, 78, 92, 88])
+
+        assert result["count"] == 5
+        assert result["sum"] == 433
+        assert result["median"] == 88
+        assert result["range"] == 14
+
+
+class TestFormatStringTemplate:
+    """Test cases for Format String Template."""
+
+    VARIABLES: ClassVar[Dict[str, Any]] = {"name": "john doe", "n": 5}
+
+    @pytest.mark.parametrize("template, expected", [
+        ("Hello {name}!", "Hello john doe!"),
+        ("{name!upper} {name!title} {name!lower} {name!bogus}", "JOHN DOE John Doe john doe john doe"),
+        ("{missing:fallback} {name:fallback}", "fallback john doe"),
+        ("{n:>5}", "5"),
+        ("x {name} {missing} y", "x john doe {missing} y"),
+        ("{{name}}", "{{name}}"),
+        ("a {} b {0}", "a {} b {0}"),
+        ("{name.attr} {name[0]}", "{name.attr} {name[0]}"),
+        ("unbalanced { {name}", "unbalanced { {name}"),
+        ("}{name}}", "}john doe}"),
+    ])
+    def test_skip_missing(self, processor, template, expected):
+        """Test custom placeholders, literal braces and unknown names left in place."""
+        assert processor.format_string_template(template, self.VARIABLES) == expected
+
+    @pytest.mark.parametrize("template, expected", [
+        ("x {name} {missing} y", "x john doe  y"),
+        ("{missing!upper}", ""),
+        ("{{name}}", "}"),
+        ("{0}", ""),
+    ])
+    def test_default_missing(self, processor, template, expected):
+        """Test that unknown placeholders are replaced by an empty string."""
+        assert processor.format_string_template(template, self.VARIABLES, "default") == expected
+
+    @pytest.mark.parametrize("template, missing", [
+        ("x {name} {missing} y", "missing"),
+        ("{{name}}", "{name"),
+        ("{name.attr}", "name.attr"),
+    ])
+    def test_error_on_missing(self, processor, template, missing):
+        """Test that the first unknown placeholder raises and names the variable."""
+        with pytest.raises(ValueError, match=f"^Missing variable: {re.escape(missing)}$"):
+            processor.format_string_template(template, self.VARIABLES, "error")
+
+    def test_default_value_beats_error_handler(self, processor):
+        """Test that an inline default is used even with the error handler."""
+        assert processor.format_string_template("{missing:fallback}", {}, "error") == "fallback"
+
+
+class TestMergeDictionaries:
+    """Test cases for Merge Dictionaries."""
+
+    @pytest.mark.parametrize("strategy, expected", [
+        ("override", {"a": 3, "b": 2, "c": {"y": 2}, "d": 4}),
+        ("keep_last", {"a": 3, "b": 2, "c": {"y": 2}, "d": 4}),
+        ("keep_first", {"a": 1, "b": 2, "c": {"x": 1}, "d": 4}),
+        ("deep_merge", {"a": 3, "b": 2, "c": {"x": 1, "y": 2}, "d": 4}),
+    ])
+    def test_strategies(self, processor, strategy, expected):
+        """Test values and first-seen key order for each strategy."""
+        result = processor.merge_dictionaries(
+            {"a": 1, "c": {"x": 1}}, {"b": 2, "c": {"y": 2}}, {"d": 4, "a": 3}, strategy=strategy
+        )
+
+        assert result == expected
+        assert list(result) == ["a", "c", "b", "d"]
+
+    def test_deep_merge_nested(self, processor):
+        """Test recursion through several levels and dict/non-dict replacement."""
+        base = {"user": {"name": "John", "address": {"city": "NYC", "zip": "10001"}}, "tags": {"a": 1}}
+        update = {"user": {"address": {"city": "Boston"}, "age": 30}, "tags": ["x"]}
+        extra = {"user": {"address": {"street": "Main"}}, "tags": {"b": 2}}
+
+        assert processor.merge_dictionaries(base, update, extra, strategy="deep_merge") == {
+            "user": {"name": "John", "address": {"city": "Boston", "zip": "10001", "street": "Main"}, "age": 30},
+            "tags": {"b": 2},
+        }
+
+    @pytest.mark.parametrize("strategy", ["override", "keep_first", "keep_last", "deep_merge"])
+    def test_inputs_are_not_modified(self, processor, strategy):
+        """Test that merging leaves every input dictionary unchanged."""
+        inputs = [
+            {"config": {"db": {"host": "a"}}},
+            {"config": {"db": {"port": 1}, "cache": {"on": True}}},
+            {"config": {"db": {"user": "u"}, "cache": {"size": 2}}},
+        ]
+        snapshot = copy.deepcopy(inputs)
+
+        processor.merge_dictionaries(*inputs, strategy=strategy)
+
+        assert inputs == snapshot
+
+    def test_deep_merge_result_does_not_alias_merged_inputs(self, processor):
+        """Test that nested dicts merged into are copies, so editing the result leaves the inputs alone."""
+        inputs = [
+            {"config": {"db": {"host": "a"}}},
+            {"config": {"db": {"port": 1}, "cache": {"on": True}}},
+            {"config": {"db": {"user": "u"}, "cache": {"size": 2}}},
+        ]
+        snapshot = copy.deepcopy(inputs)
+
+        result = processor.merge_dictionaries(*inputs, strategy="deep_merge")
+        result["config"]["db"]["host"] = "changed"
+        result["config"]["cache"]["on"] = False
+
+        assert result == {"config": {"db": {"host": "changed", "port": 1, "user": "u"},
+                                     "cache": {"on": False, "size": 2}}}
+        assert inputs == snapshot
+
+    def test_no_dictionaries(self, processor):
+        """Test that merging nothing gives an empty dictionary."""
+        assert processor.merge_dictionaries() == {}
+
+
+class TestCompareDataStructures:
+    """Test cases for Compare Data Structures with ignore_order."""
+
+    @pytest.mark.parametrize("data1, data2, removed, added", [
+        ([3, 1, 3, 2, 3], [2, 3], [1, 3, 3], []),
+        (["b", "a"], ["c", "a", "b", "d", "c"], [], ["c", "d", "c"]),
+        ([2, 1, 2, 1], [1, 9, 2, 8], [2, 1], [9, 8]),
+    ])
+    def test_multiset_diff_keeps_input_order(self, processor, data1, data2, removed, added):
+        """Test that duplicates count and the surplus items keep their input order."""
+        result = processor.compare_data_structures(data1, data2, ignore_order=True)
+
+        assert result["equal"] is False
+        assert result["removed"] == removed
+        assert result["added"] == added
+
+    def test_reordered_lists_are_equal(self, processor):
+        """Test that the same items in another order compare equal."""
+        result = processor.compare_data_structures([3, 1, 3, 2], [2, 3, 1, 3], ignore_order=True)
+
+        assert result == {"equal": True, "added": {}, "removed": {}, "modified": {}}
+
+    @pytest.mark.parametrize("data1, data2", [
+        ([3, 1, 3, 2, 3], [2, 3]),
+        ([2, 1, 2, 1], [1, 9, 2, 8]),
+    ])
+    def test_unhashable_items_match_hashable_path(self, processor, data1, data2):
+        """Test that lists of unhashable items give the same diff as hashable ones."""
+        def wrap(items):
+            return [[item] for item in items]
+
+        hashable = processor.compare_data_structures(data1, data2, ignore_order=True)
+        unhashable = processor.compare_data_structures(wrap(data1), wrap(data2), ignore_order=True)
+
+        assert unhashable["equal"] is hashable["equal"]
+        assert unhashable["removed"] == wrap(hashable["removed"])
+        assert unhashable["added"] == wrap(hashable["added"])
+
+    def test_unhashable_equal_lists(self, processor):
+        """Test that reordered lists of dicts compare equal."""
+        data1 = [{"id": 1}, {"id": 2}, {"id": 1}]
+        data2 = [{"id": 2}, {"id": 1}, {"id": 1}]
+
+        assert processor.compare_data_structures(data1, data2, ignore_order=True)["equal"] is True
+
+
+class TestValidateJsonStructure:
+    """Test cases for Validate Json Structure."""
+
+    @pytest.mark.parametrize("data, expected", [
+        ({"name": "John", "age": 30}, True),
+        ({"name": "John", "age": True}, True),
+        ({"name": "John"}, False),
+        ({"name": "John", "age": "30"}, False),
+        ('{"name": "John", "age": 30}', True),
+    ])
+    def test_schema_checks(self, processor, data, expected):
+        """Test key presence and isinstance checks, including subclasses."""
+        assert processor.validate_json_structure(data, {"name": str, "age": int}) is expected
+
+    def test_tuple_of_types(self, processor):
+        """Test that a tuple of types accepts any of them."""
+        schema = {"value": (int, float)}
+
+        assert processor.validate_json_structure({"value": 1.5}, schema) is True
+        assert processor.validate_json_structure({"value": "1.5"}, schema) is False
+
+
+class TestTransformJsonData:
+    """Test cases for Transform JSON Data."""
+
+    def test_nested_and_missing_fields(self, processor):
+        """Test dotted paths, missing fields and the default value."""
+        data = {"user": {"name": "John", "contact": {"email": "john@example.com"}}, "id": 7}
+        mapping = {
+            "username": "user.name",
+            "email": "user.contact.email",
+            "phone": "user.contact.phone",
+            "id": "id",
+            "missing": "nothing",
+        }
+
+        assert processor.transform_json_data(data, mapping, default_value="n/a") == {
+            "username": "John",
+            "email": "john@example.com",
+            "phone": "n/a",
+            "id": 7,
+            "missing": "n/a",
+        }
+
+    def test_none_stops_nested_lookup(self, processor):
+        """Test that a None along a dotted path yields the default value."""
+        data = {"user": None}
+
+        assert processor.transform_json_data(data, {"name": "user.name"}, "x") == {"name": "x"}
+
+    def test_reused_mapping(self, processor):
+        """Test that a mapping reused across calls gives independent results."""
+        mapping = {"name": "user.name"}
+        first = processor.transform_json_data({"user": {"name": "A"}}, mapping)
+        second = processor.transform_json_data({"user": {"name": "B"}}, mapping)
+
+        assert (first, second) == ({"name": "A"}, {"name": "B"})
+
+
+class TestJsonParsing:
+    """Test cases for JSON parsing in Validate Json Structure and Transform JSON Data."""
+
+    @pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+    def backend(self, request, monkeypatch):
+        """Run each test with orjson, when installed, and with the stdlib fallback."""
+        if request.param and not data_processor.ORJSON_AVAILABLE:
+            pytest.skip("orjson is not installed")
+        monkeypatch.setattr(data_processor, "ORJSON_AVAILABLE", request.param)
+
+    @pytest.mark.parametrize("text", ['{"value": NaN}', '{"value": Infinity}', '{"value": -Infinity}'])
+    def test_non_finite_numbers_are_accepted(self, processor, backend, text):
+        """Test that NaN and Infinity parse as they do with the stdlib."""
+        assert processor.validate_json_structure(text, {"value": float}) is True
+
+    @pytest.mark.parametrize("number", [
+        123456789012345678901234567890,
+        -9223372036854775809,
+        -9999999999999999999,
+        18446744073709551615,
+    ])
+    def test_big_ints_stay_exact(self, processor, backend, number):
+        """Test that integers outside the int64 range are not turned into floats."""
+        text = f'{{"id": {number}}}'
+        result = processor.transform_json_data(text, {"id": "id"})
+
+        assert result == {"id": number}
+        assert type(result["id"]) is int
+        assert processor.validate_json_structure(text, {"id": int}) is True
+
+    def test_invalid_json(self, processor, backend):
+        """Test that invalid JSON fails validation and raises the stdlib error."""
+        assert processor.validate_json_structure('{"name": ', {"name": str}) is False
+        with pytest.raises(json.JSONDecodeError):
+            processor.transform_json_data('{"name": ', {"name": "name"})
+
+    def test_snapshot_hash_is_backend_independent(self, processor, monkeypatch):
+        """Test that snapshot hashes do not depend on orjson being installed."""
+        data = {"big": 1e16, "small": 1e-7, "missing": float("nan"), "name": "é"}
+        expected = hashlib.blake2b(
+            json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode(),
+            digest_size=16
+        ).hexdigest()
+
+        assert processor.create_data_snapshot(data)["metadata"]["hash"] == expected
+
+
+class TestWeekendChecks:
+    """Test cases for Is Weekend and Is Weekday."""
+
+    @pytest.mark.parametrize("date_string, format, weekend", [
+        ("2024-01-13 10:00:00", None, True),
+        ("2024-01-14 10:00:00", None, True),
+        ("2024-01-15 10:00:00", None, False),
+        ("2024-01-13 10:00:00", "", True),
+        ("2024-01-13", "%Y-%m-%d", True),
+        ("15/01/2024", "%d/%m/%Y", False),
+    ])
+    def test_weekend_and_weekday(self, datetime_lib, date_string, format, weekend):
+        """Test both keywords for default and custom formats."""
+        assert datetime_lib.is_weekend(date_string, format) is weekend
+        assert datetime_lib.is_weekday(date_string, format) is not weekend
+
+
+class TestParseDatetime:
+    """Test cases for Parse Datetime and the other keywords sharing its parser."""
+
+    @pytest.mark.parametrize("date_string, format", [
+        ("2024-01-15 10:30:00", None),
+        ("2024-01-15T10:30:00", "%Y-%m-%dT%H:%M:%S"),
+        ("2024-01-15", "%Y-%m-%d"),
+        ("2024-01- 5 10:30:00", None),
+        ("15/01/2024 10:30", "%d/%m/%Y %H:%M"),
+    ])
+    def test_matches_strptime(self, datetime_lib, date_string, format):
+        """Test that parsing gives exactly what strptime gives."""
+        expected = datetime.strptime(date_string, format or "%Y-%m-%d %H:%M:%S")
+
+        assert datetime_lib.parse_datetime(date_string, format) == expected
+
+    @pytest.mark.parametrize("date_string, format", [
+        ("2024-01-15 24:00:00", None),
+        ("2024-01-15T24:00:00", "%Y-%m-%dT%H:%M:%S"),
+        ("2024-02-30 10:00:00", None),
+        ("2024-01-15 10:60:00", None),
+        ("2024-01-15 10:30:00", "%Y-%m-%d"),
+    ])
+    def test_rejects_what_strptime_rejects(self, datetime_lib, date_string, format):
+        """Test that strings strptime refuses raise ValueError, e.g. hour 24."""
+        with pytest.raises(ValueError):
+            datetime_lib.parse_datetime(date_string, format)
+        with pytest.raises(ValueError):
+            datetime_lib.add_days(date_string, 1, format)
+
+    @pytest.mark.parametrize("format", [None, "%Y-%m-%d %H:%M:%S", ""])
+    def test_list_matches_single_parses(self, datetime_lib, format):
+        """Test that Parse Datetime List gives what Parse Datetime gives per item."""
+        date_strings = ["2024-01-15 10:30:00", "2023-12-31 23:59:59", "2024-01-15 10:30:00"]
+
+        assert datetime_lib.parse_datetime_list(date_strings, format) == [
+            datetime_lib.parse_datetime(date_string, format) for date_string in date_strings
+        ]
+
+    def test_list_empty(self, datetime_lib):
+        """Test that an empty list parses to an empty list."""
+        assert datetime_lib.parse_datetime_list([]) == []
+
+    def test_list_rejects_invalid_item(self, datetime_lib):
+        """Test that one unparsable string raises ValueError for the whole list."""
+        with pytest.raises(ValueError):
+            datetime_lib.parse_datetime_list(["2024-01-15 10:30:00", "2024-01-15 24:00:00"])
+
+
+class TestExecuteQueryColumnar:
+    """Test cases for the Execute Query Columnar keyword."""
+
+    def test_matches_row_results(self):
+        """Test that the columns are the row results of Execute Query transposed."""
+        db = db_utils.DBUtils()
+        query = "SELECT id, name, age FROM users"
+        rows = db.execute_query(query)
+
+        assert db.execute_query_columnar(query) == {
+            column: [row[column] for row in rows] for column in rows[0]
+        }
+
+
+class TestBasicAuth:
+    """Test cases for Set Basic Auth."""
+
+    def test_header_value(self, client):
+        """Test the Authorization header for one and then another credential pair."""
+        client.set_basic_auth("admin", "secret123")
+        assert client._session_headers["Authorization"] == "Basic YWRtaW46c2VjcmV0MTIz"
+
+        client.set_basic_auth("user", "pass")
+        assert client._session_headers["Authorization"] == "Basic dXNlcjpwYXNz"
+
+    def test_credentials_are_not_shared_or_kept(self, client):
+        """Test that credentials stay on their instance and Clear Headers drops them."""
+        client.set_basic_auth("admin", "secret123")
+
+        assert http_client.HTTPClient()._basic_auth is None
+        client.clear_headers()
+        assert client._basic_auth is None
+        assert "Authorization" not in client._session_headers
+
+
+class TestParseJsonResponse:
+    """Test cases for Parse Json Response."""
+
+    def test_results_are_independent(self, client):
+        """Test that changing one parsed result does not affect the next parse."""
+        response = {"status": 200, "body": '{"items": [1, 2]}'}
+        first = client.parse_json_response(response)
+        first["items"].append(3)
+
+        assert client.parse_json_response(response) == {"items": [1, 2]}
+
+    def test_non_string_body(self, client):
+        """Test that an already parsed body is returned as is."""
+        body = {"message": "ok"}
+
+        assert client.parse_json_response({"body": body}) is body
+
+
+class TestEnumLibraryKeywords:
+    """Test cases for the keywords of the sample EnumLibrary."""
+
+    @pytest.fixture
+    def library(self):
+        """Create an EnumLibrary instance."""
+        return enum_library.EnumLibrary()
+
+    def test_process_with_status(self, library):
+        """Test that member names and values are returned as plain str/int."""
+        result = library.process_with_status(
+            "item-123", enum_library.Status.ACTIVE, enum_library.Priority.HIGH
+        )
+
+        assert result == {
+            "item": "item-123",
+            "status": "ACTIVE",
+            "status_value": 2,
+            "priority": "HIGH",
+            "priority_value": 3,
+        }
+        assert type(result["status_value"]) is int
+
+    def test_log_message(self, library, capsys):
+        """Test the printed log line for a level and a color."""
+        library.log_message("hello", enum_library.LogLevel.WARNING, enum_library.Color.RED)
+
+        assert capsys.readouterr().out == "[WARNING] [red] hello\n"
+
+    @pytest.mark.parametrize("member, text", [
+        (enum_library.Status.ACTIVE, "Status.ACTIVE"),
+        (enum_library.Priority.HIGH, "Priority.HIGH"),
+        (enum_library.LogLevel.INFO, "LogLevel.INFO"),
+        (enum_library.Color.RED, "Color.RED"),
+    ])
+    def test_members_are_plain_enums(self, member, text):
+        """Test that members keep the plain Enum string form and do not equal their values."""
+        assert str(member) == text
+        assert f"{member}" == text
+        assert member != member.value
+
+
+class TestExtractNumbers:
+    """Test cases for Extract Numbers."""
+
+    @pytest.mark.parametrize("text", [
+        "Price: $99.99, Quantity: 5",
+        "",
+        "order 123 qty 7 price 99.99 id=0045 ok; " * 300,
+        "1" * 30,
+        "\u0663\u0664 5",
+    ])
+    def test_matches_regex(self, strings, text):
+        """Test that long, overlong and non-ASCII digit runs give what re.findall gives."""
+        assert strings.extract_numbers(text) == [int(match) for match in re.findall(r'\d+', text)]
+
+
+class TestBatchKeywords:
+    """Test cases for Extract Numbers Batch and Count Occurrences Batch."""
+
+    ROWS: ClassVar[List[str]] = [
+        "order 1 qty 7 price 99.99",
+        "",
+        "no numbers here",
+        "007 starts and ends 42",
+        "9" * 18,
+    ]
+
+    @pytest.mark.parametrize("rows", [
+        ROWS,
+        [],
+        [*ROWS, "1" * 25],
+        [*ROWS, "٣٤ and 5"],
+    ], ids=["ascii", "empty", "beyond-int64", "non-ascii-digits"])
+    def test_extract_numbers_batch(self, strings, rows):
+        """Test that each row matches Extract Numbers."""
+        assert strings.extract_numbers_batch(rows) == [strings.extract_numbers(row) for row in rows]
+
+    @pytest.mark.parametrize("substring, case_sensitive", [
+        ("o", True),
+        ("O", False),
+        ("", True),
+        ("numbers", True),
+    ])
+    def test_count_occurrences_batch(self, strings, substring, case_sensitive):
+        """Test that each row matches Count Occurrences."""
+        rows = [*self.ROWS, "Ünïcode ÜÜ", "İstanbul"]
+
+        assert strings.count_occurrences_batch(rows, substring, case_sensitive) == \
+            [strings.count_occurrences(row, substring, case_sensitive) for row in rows]
+
+    @pytest.mark.parametrize("bad_row", [None, 5, b"12"])
+    def test_non_string_rows_are_rejected(self, strings, bad_row):
+        """Test that a row that is not a string raises a TypeError naming it."""
+        rows = ["1 2", bad_row]
+
+        with pytest.raises(TypeError, match=r"texts\[1\] must be a string"):
+            strings.extract_numbers_batch(rows)
+        with pytest.raises(TypeError, match=r"texts\[1\] must be a string"):
+            strings.count_occurrences_batch(rows, "1")
+
+
+class TestReadJsonFile:
+    """Test cases for Read Json File."""
+
+    @pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+    def backend(self, request, monkeypatch):
+        """Run each test with orjson, when installed, and with the stdlib fallback."""
+        if request.param and not file_utils.ORJSON_AVAILABLE:
+            pytest.skip("orjson is not installed")
+        monkeypatch.setattr(file_utils, "ORJSON_AVAILABLE", request.param)
+
+    @pytest.mark.parametrize("text", [
+        '{"name": "John", "tags": ["a", "é"]}',
+        '{"big": 123456789012345678901234567890}',
+        '{"small": -9223372036854775809}',
+        '[-9999999999999999999]',
+        '{"value": NaN, "limit": Infinity}',
+    ])
+    def test_matches_stdlib(self, backend, tmp_path, text):
+        """Test that files load exactly as json.loads would load them."""
+        path = tmp_path / "data.json"
+        path.write_text(text, encoding="utf-8")
+        result = file_utils.FileUtils().read_json_file(str(path))
+
+        assert json.dumps(result) == json.dumps(json.loads(text))
+
+    def test_invalid_json(self, backend, tmp_path):
+        """Test that invalid files raise the stdlib error."""
+        path = tmp_path / "data.json"
+        path.write_text('{"name": ', encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            file_utils.FileUtils().read_json_file(str(path))
+
+
+class TestListFiles:
+    """Test cases for List Files."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        """Create a small directory tree with files and a subdirectory."""
+        for name in ["a.txt", "b.TXT", "c.log", "ab.txt", "sub/d.txt", "sub/e.log"]:
+            path = tmp_path / name
+            path.parent.mkdir(exist_ok=True)
+            path.write_text(name)
+        (tmp_path / "dir.txt").mkdir()
+        return tmp_path
+
+    @pytest.mark.parametrize("pattern", [None, "*.txt", "a*", "[ab]*", "*/d.txt", "**/*.txt", "*.nothing"])
+    def test_matches_pathlib(self, tree, pattern):
+        """Test that files are listed as Path.iterdir / Path.glob would list them."""
+        path = Path(tree)
+        expected = path.glob(pattern) if pattern else path.iterdir()
+        expected = sorted(str(f) for f in expected if f.is_file())
+
+        assert sorted(file_utils.FileUtils().list_files(str(tree), pattern)) == expected
+
+    def test_missing_directory(self, tmp_path):
+        """Test a missing directory: empty with a pattern, an error without one."""
+        missing = str(tmp_path / "missing")
+
+        assert file_utils.FileUtils().list_files(missing, "*.txt") == []
+        with pytest.raises(FileNotFoundError):
+            file_utils.FileUtils().list_files(missing)
+
+
+class TestCopyAndMoveFile:
+    """Test cases for the Copy File and Move File options."""
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        """Create a source file with an old modification time."""
+        path = tmp_path / "source.txt"
+        path.write_text("content")
+        os.utime(path, (1_000_000_000, 1_000_000_000))
+        (tmp_path / "backup").mkdir()
+        return path
+
+    def test_copy_preserves_metadata_by_default(self, source):
+        """Test that the default copy keeps the modification time."""
+        destination = source.parent / "copy.txt"
+        file_utils.FileUtils().copy_file(str(source), str(destination))
+
+        assert destination.read_text() == "content"
+        assert destination.stat().st_mtime == source.stat().st_mtime
+
+    @pytest.mark.parametrize("into_directory", [False, True])
+    def test_copy_content_only(self, source, into_directory):
+        """Test a content-only copy to a file path and into a directory."""
+        target = source.parent / "backup"
+        destination = target / source.name
+        file_utils.FileUtils().copy_file(
+            str(source), str(target if into_directory else destination), preserve_metadata=False
+        )
+
+        assert destination.read_text() == "content"
+        assert destination.stat().st_mtime != source.stat().st_mtime
+
+    @pytest.mark.parametrize("same_filesystem", [False, True])
+    def test_move_into_directory(self, source, same_filesystem):
+        """Test that moving into a directory keeps the file name."""
+        target = source.parent / "backup"
+        file_utils.FileUtils().move_file(str(source), str(target), same_filesystem=same_filesystem)
+
+        assert not source.exists()
+        assert (target / source.name).read_text() == "content"
+
+    def test_move_same_filesystem_overwrites(self, source):
+        """Test that a same-filesystem move replaces an existing destination."""
+        destination = source.parent / "existing.txt"
+        destination.write_text("old")
+        file_utils.FileUtils().move_file(str(source), str(destination), same_filesystem=True)
+
+        assert not source.exists()
+        assert destination.read_text() == "content"
+
+    def test_move_same_filesystem_missing_source(self, source):
+        """Test that a same-filesystem move of a missing file raises."""
+        with pytest.raises(FileNotFoundError):
+            file_utils.FileUtils().move_file(
+                str(source.parent / "missing.txt"), str(source.parent / "backup"), same_filesystem=True
+            )
+
+
+class TestRemoveWhitespace:
+    """Test cases for the whitespace-stripping modes of Remove Whitespace."""
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "  hello \t world \n",
+        "a\x0bb\x0cc\rd\x1ce\x1df\x1eg\x1fh",
+        "no-spaces",
+        "café \u00a0au\u2003lait\u3000",
+        "\u2028line\u2029break\x85",
+    ])
+    def test_all_matches_regex(self, strings, text):
+        """Test that mode 'all' removes exactly what the \\s+ regex removes."""
+        assert strings.remove_whitespace(text, "all") == re.sub(r'\s+', '', text)
+
+    @pytest.mark.parametrize("mode, expected", [
+        ("leading", "a b  "),
+        ("trailing", "  a b"),
+        ("both", "a b"),
+        ("unknown", "  a b  "),
+    ])
+    def test_other_modes(self, strings, mode, expected):
+        """Test the modes that only strip the ends."""
+        assert strings.remove_whitespace("  a b  ", mode) == expected
+
+
+class TestRemoveDuplicates:
+    """Test cases for the Remove Duplicates keyword."""
+
+    @pytest.mark.parametrize("text, separator, expected", [
+        ("a,b,a,c,b", ",", "a,b,c"),
+        ("c b a b c", " ", "c b a"),
+        ("a,,b,,a", ",", "a,,b"),
+        ("", ",", ""),
+        ("x--y--x", "--", "x--y"),
+    ])
+    def test_keeps_first_occurrence_order(self, strings, text, separator, expected):
+        """Test that duplicates are dropped and first-seen order is kept."""
+        assert strings.remove_duplicates(text, separator) == expected
+
+
+class TestGenerateRandomString:
+    """Test cases for the Generate Random String keyword."""
+
+    @pytest.mark.parametrize("flags, alphabet", [
+        ((True, True, True, False), string.ascii_letters + string.digits),
+        ((True, False, False, False), string.ascii_uppercase),
+        ((False, True, False, False), string.ascii_lowercase),
+        ((False, False, True, True), string.digits + "!@#$%^&*"),
+        ((False, False, False, False), string.ascii_letters + string.digits),
+    ])
+    def test_uses_selected_alphabet(self, strings, flags, alphabet):
+        """Test the length and character set for each flag combination."""
+        result = strings.generate_random_string(200, *flags)
+
+        assert len(result) == 200
+        assert set(result) <= set(alphabet)
+
+    def test_zero_length(self, strings):
+        """Test that a zero length gives an empty string."""
+        assert strings.generate_random_string(0) == ""
+
+
+class TestPrecompiledPatterns:
+    """Test cases for the keywords using module-level compiled regexes."""
+
+    def test_extract_emails(self, strings):
+        """Test that email extraction finds addresses and rejects '|' in the domain suffix."""
+        text = "Contact john.doe@example.com, jane@test.org or bad@host.c|m"
+
+        assert strings.extract_emails(text) == ["john.doe@example.com", "jane@test.org"]
+
+    @pytest.mark.parametrize("url, valid", [
+        ("https://example.com/path?a=1#top", True),
+        ("http://localhost:8080", True),
+        ("ftp://example.com", False),
+        ("not a url", False),
+    ])
+    def test_validate_url(self, strings, url, valid):
+        """Test URL validation with the compiled pattern."""
+        assert strings.validate_url(url) is valid
+
+    def test_replace_pattern(self, strings):
+        """Test that Replace Pattern gives what re.sub gives, with and without case sensitivity."""
+        text = "Hello World hello"
+
+        assert strings.replace_pattern(text, r"hello", "bye") == text.replace("hello", "bye")
+        assert strings.replace_pattern(text, r"hello", "bye", case_sensitive=False) == "bye World bye"
+
+    def test_extract_json_from_text(self, strings):
+        """Test that the first object, including one nested level, is extracted."""
+        assert strings.extract_json_from_text('x {"a": {"b": 1}} y') == {"a": {"b": 1}}
+
+
+class TestWriteFiles:
+    """Test cases for the parent directory handling of the write keywords."""
+
+    def test_recreates_directory_removed_between_writes(self, tmp_path):
+        """Test that a cached parent directory deleted after the first write is created again."""
+        files = file_utils.FileUtils()
+        directory = tmp_path / "out" / "nested"
+        files.write_file_content(str(directory / "a.txt"), "first")
+        shutil.rmtree(tmp_path / "out")
+
+        files.write_file_content(str(directory / "a.txt"), "second")
+        files.write_json_file(str(directory / "b.json"), {"key": "value"})
+
+        assert (directory / "a.txt").read_text() == "second"
+        assert json.loads((directory / "b.json").read_text()) == {"key": "value"}
+        assert str(directory) in file_utils._known_dirs
+
+    def test_file_in_current_directory(self, tmp_path, monkeypatch):
+        """Test that a bare file name is written without creating directories."""
+        monkeypatch.chdir(tmp_path)
+        file_utils.FileUtils().write_file_content("plain.txt", "content")
+
+        assert (tmp_path / "plain.txt").read_text() == "content"
+
+
+class TestGetFileExtension:
+    """Test cases for the splitext fast path of Get File Extension."""
+
+    @pytest.mark.parametrize("file_path, expected", [
+        ("report.txt", "txt"),
+        ("archive.tar.gz", "gz"),
+        ("a/.hidden.txt", "txt"),
+        ("noext", ""),
+        (".bashrc", ""),
+        ("a/.hidden", ""),
+        ("...", ""),
+        ("file.", ""),
+        ("a.b.", ""),
+        ("a..b", "b"),
+        ("..c", "c"),
+        ("dir.d/", "d"),
+        ("x/y.z/", "z"),
+    ])
+    def test_matches_pathlib(self, file_path, expected):
+        """Test dotfiles, multi-dot names, no extension and trailing separators."""
+        result = file_utils.FileUtils().get_file_extension(file_path)
+
+        assert result == expected
+        assert result == Path(file_path).suffix.lstrip(".")
+        if os.path.splitext(file_path)[1][1:]:
+            assert result == os.path.splitext(file_path)[1][1:]
+
+    def test_matches_pathlib_exhaustively(self):
+        """Test every short path built from letters, dots and separators against pathlib."""
+        files = file_utils.FileUtils()
+        for length in range(1, 6):
+            for parts in itertools.product(["a", ".", "/", ".."], repeat=length):
+                file_path = "".join(parts)
+                assert files.get_file_extension(file_path) == Path(file_path).suffix.lstrip("."), file_path